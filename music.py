@@ -5,7 +5,7 @@ Analyzes FLAC filenames and generates proper classical music metadata
 Automatically converts non-FLAC audio files (MP4/M4A/etc) to FLAC using ffmpeg
 
 Requirements:
-    pip install mutagen openai rich
+    pip install mutagen openai rich tenacity diskcache "httpx[http2]"
 
 Usage:
     export OPENROUTER_API_KEY="your-api-key-here"
@@ -16,12 +16,21 @@ import os
 import sys
 import json
 import re
-import subprocess
 import shutil
 import io
+import asyncio
+import argparse
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from mutagen.flac import FLAC, Picture
-from openai import OpenAI
+import httpx
+import openai
+from openai import AsyncOpenAI
+from tenacity import retry, wait_random_exponential, stop_after_attempt, retry_if_exception_type
+import diskcache
 import random
 import hashlib
 try:
@@ -31,10 +40,11 @@ except ImportError:
     HAS_PILLOW = False
 
 # Rich TUI imports
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.live import Live
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
 from rich.box import ROUNDED, DOUBLE
@@ -45,6 +55,169 @@ console = Console()
 # Default model - can be changed to any OpenRouter supported model
 DEFAULT_MODEL = "google/gemini-3-flash-preview"
 
+
+class AsyncLimiter:
+    """Sliding-window RPM/TPM throttle for OpenRouter calls.
+
+    Keeps request timestamps and response token counts for the last 60
+    seconds and sleeps whenever another request would exceed either
+    ceiling, so concurrent calls stay pinned near the rate limit instead
+    of oscillating into 429s.
+    """
+
+    def __init__(self, max_requests_per_minute=60, max_tokens_per_minute=250000):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self._requests = deque()  # timestamps of recent requests
+        self._tokens = deque()    # (timestamp, token count) of recent responses
+
+    def _prune(self, now):
+        cutoff = now - 60.0
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._tokens.popleft()
+
+    def count_tokens(self, total_tokens):
+        """Record tokens spent by a completed response against the window"""
+        self._tokens.append((time.monotonic(), total_tokens))
+
+    async def __aenter__(self):
+        while True:
+            now = time.monotonic()
+            self._prune(now)
+            tokens_in_window = sum(t for _, t in self._tokens)
+            if (len(self._requests) < self.max_requests_per_minute
+                    and tokens_in_window < self.max_tokens_per_minute):
+                self._requests.append(now)
+                return self
+            # Sleep until the oldest event in the window expires
+            oldest = []
+            if self._requests:
+                oldest.append(self._requests[0])
+            if self._tokens:
+                oldest.append(self._tokens[0][0])
+            wait = max(0.05, min(oldest) + 60.0 - now) if oldest else 1.0
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# Concurrency cap and rate limiter shared by all OpenRouter calls
+SEM = asyncio.Semaphore(int(os.getenv("OPENROUTER_CONCURRENCY", "16")))
+LIMITER = AsyncLimiter()
+
+# ffmpeg's FLAC encoder is single-core, so run one conversion per core
+FFMPEG_SEM = asyncio.Semaphore(os.cpu_count() or 4)
+
+# FLAC compression preset: 5 encodes ~3x faster than the max preset 8
+# for under 1% extra size. --flac-compression restores 8 for archival use.
+FLAC_COMPRESSION = 5
+
+# How many filenames to pack into a single OpenRouter request
+BATCH_SIZE = int(os.getenv("OPENROUTER_BATCH_SIZE", "16"))
+
+# Stage widths for the process_folder_normal pipeline: concurrent LLM
+# batch requests and tag-writer threads
+LLM_WORKERS = 4
+TAG_WRITERS = 2
+
+# Cap on response length - a full metadata object is ~200 tokens
+MAX_RESPONSE_TOKENS = 400
+
+# Models that support OpenAI-style JSON mode (response_format json_object).
+# For these, single-file responses arrive as bare JSON and skip the
+# markdown code-fence stripping; other models keep the regex fallback.
+JSON_MODE_MODELS = {
+    "google/gemini-3-flash-preview",
+    "google/gemini-2.5-flash",
+    "openai/gpt-4o",
+    "openai/gpt-4o-mini",
+    "openai/gpt-5.1",
+}
+
+# On-disk response cache so re-runs over an unchanged library skip the
+# network entirely. Opened in main() unless --no-cache is passed.
+CACHE_DIR = Path.home() / ".cache" / "music-tagger"
+CACHE_EXPIRE = 30 * 86400  # seconds
+PROMPT_VERSION = "1"  # bump to invalidate cached responses when the prompt changes
+CACHE = None
+
+# Full per-file metadata tables are only rendered with --verbose; the
+# default is a one-line log per file so large runs don't drown in
+# Rich table renders
+VERBOSE = False
+
+# Shared httpx pool behind the AsyncOpenAI client; created in
+# setup_openrouter and closed when main() exits
+HTTP_CLIENT = None
+
+
+def _cache_key(filename, context_files, existing_metadata=None):
+    """Stable key for one metadata lookup: model, prompt version and inputs"""
+    raw = "|".join([
+        DEFAULT_MODEL,
+        PROMPT_VERSION,
+        filename,
+        ",".join(sorted(context_files or [])),
+        json.dumps(existing_metadata, sort_keys=True) if existing_metadata else "",
+    ])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+# Field spec and guidelines shared by the single-file and batch prompts
+METADATA_FIELDS_SPEC = """{
+    "composer": "Last name, First name",
+    "composer_short": "Last name only (e.g., Beethoven, Mozart, Chopin)",
+    "work_full": "Full official work title with catalog number (e.g., Piano Concerto No. 2 in B-flat major, Op. 19)",
+    "work_short": "SHORT searchable name that people actually search for (e.g., Piano Concerto No. 2, Symphony No. 5, Nocturne Op. 9 No. 2, Moonlight Sonata)",
+    "movement": "Movement number and name if applicable (e.g., II. Adagio sostenuto)",
+    "movement_name": "Just the movement name without number if exists (e.g., Adagio sostenuto)",
+    "performers": ["Primary performer/conductor names"],
+    "orchestra": "Orchestra/Ensemble name",
+    "soloists": ["Soloist names with instrument"],
+    "date": "Recording year if present",
+    "disc": "Disc number if multi-disc",
+    "track": "Track number (just the number, e.g., 01, 02, 12)",
+    "suggested_filename": "MUST use work_short NOT work_full! Format: TrackNum - ComposerShort - WorkShort - Movement - Performer"
+}"""
+
+METADATA_GUIDELINES = """CRITICAL Guidelines for suggested_filename:
+- ALWAYS use the SHORT searchable work name (work_short), NOT the full official name!
+- Users need to SEARCH for these files - use names people actually search for
+- BAD: "01 - Beethoven - Piano Sonata No. 14 in C-sharp minor, Op. 27 No. 2 - I. Adagio sostenuto - Pollini" (TOO LONG!)
+- GOOD: "01 - Beethoven - Moonlight Sonata - I. Adagio sostenuto - Pollini"
+- BAD: "05 - Mozart - Piano Concerto No. 21 in C major, K. 467 - II. Andante - Uchida"
+- GOOD: "05 - Mozart - Piano Concerto No. 21 - II. Andante - Uchida"
+- Keep filenames SHORT and SEARCHABLE
+- No catalog numbers (Op., K., BWV) in filename - put those in work_full only
+- No key signatures in filename (C major, D minor, etc.)
+
+Other guidelines:
+- Composer should be "Last, First" format, composer_short is just "Last"
+- work_full should include catalog numbers and key for metadata storage
+- work_short should be what people type when searching (simple, memorable names)"""
+
+# Menu choice sets, resolved once: which options need a folder, which
+# get a pre-scanned library, and which modify it (invalidating the scan
+# cache afterwards)
+_NEEDS_FOLDER = frozenset({'1', '2', '3'})
+_SCANNED_CHOICES = frozenset({'1', '2', '3', '6'})
+_MUTATING_CHOICES = frozenset({'1', '2', '6'})
+
+# Constructed once - the menu loop re-reads these every round-trip
+_DEFAULT_MUSIC_DIR = str(Path.home() / "Music")
+_AUDIT_PANEL = Panel(
+    "[bold magenta]Metadata Audit Mode[/bold magenta]\n\n"
+    "This will scan [bold]ALL[/bold] files in your library and use AI to:\n"
+    "  • Verify existing metadata is correct and consistent\n"
+    "  • Suggest corrections for incomplete or incorrect entries\n"
+    "  • Standardize formatting (e.g., 'Last, First' for composers)\n"
+    "  • Rename files to searchable format\n\n"
+    "[yellow]You can choose to auto-approve all changes or review each one.[/yellow]",
+    border_style="magenta"
+)
+
 # Color scheme
 COLORS = {
     "primary": "cyan",
@@ -57,9 +230,16 @@ COLORS = {
 }
 
 
+# Rendered banner ANSI, captured once - the banner never changes, so
+# later redraws are a plain write instead of a Rich markup render
+_BANNER_ANSI = None
+
+
 def show_banner():
     """Display the application banner"""
-    banner = """
+    global _BANNER_ANSI
+    if _BANNER_ANSI is None:
+        banner = """
 ╔═══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                               ║
 ║   ♪ ♫  [bold cyan]CLASSICAL MUSIC METADATA TAGGER[/bold cyan]  ♫ ♪                                  ║
@@ -68,7 +248,25 @@ def show_banner():
 ║                                                                               ║
 ╚═══════════════════════════════════════════════════════════════════════════════╝
     """
-    console.print(banner)
+        with console.capture() as capture:
+            console.print(banner)
+        _BANNER_ANSI = capture.get()
+    sys.stdout.write(_BANNER_ANSI)
+    sys.stdout.flush()
+
+
+def _redraw_screen():
+    """Clear the terminal and redraw the memoized banner in one write"""
+    sys.stdout.write("\x1b[2J\x1b[H")
+    show_banner()
+
+
+def _wait_enter():
+    """Minimal pause prompt - no Rich markup render or stream juggling
+    for a prompt that only ever waits for a newline"""
+    sys.stdout.write("\x1b[2mPress Enter to continue...\x1b[0m ")
+    sys.stdout.flush()
+    sys.stdin.readline()
 
 
 def show_menu(folder_path=None):
@@ -112,8 +310,14 @@ def show_menu(folder_path=None):
         box=ROUNDED,
         padding=(1, 4),
     )
-    console.print(menu_panel)
-    
+
+    # Render the whole screen in one Rich pass instead of a print per piece
+    screen = []
+    if folder_path:
+        screen.append(Text.from_markup(f"[green]✓ Folder path:[/green] {folder_path}\n"))
+    screen.append(menu_panel)
+    console.print(Group(*screen))
+
     choice = Prompt.ask(
         "\n[bold cyan]Select an option[/bold cyan]",
         choices=["1", "2", "3", "4", "5", "6", "q", "Q"],
@@ -134,118 +338,305 @@ def setup_openrouter():
             border_style="red",
         ))
         sys.exit(1)
-    
-    client = OpenAI(
+
+    # One shared connection pool for the whole run: HTTP/2 multiplexes
+    # concurrent requests over a single connection and keepalive avoids a
+    # TLS handshake per call. Closed in main() on exit.
+    global HTTP_CLIENT
+    HTTP_CLIENT = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=128),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+    client = AsyncOpenAI(
         base_url="https://openrouter.ai/api/v1",
         api_key=api_key,
+        http_client=HTTP_CLIENT,
     )
     return client
 
 
-def get_metadata_from_openrouter(client, filename, context_files=None, existing_metadata=None):
-    """Use OpenRouter to parse filename and generate metadata"""
-    
+@retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type((
+        openai.RateLimitError,
+        openai.InternalServerError,
+        openai.APIConnectionError,
+        openai.APITimeoutError,
+    )),
+)
+async def _create_completion(client, prompt, max_tokens=MAX_RESPONSE_TOKENS, json_mode=False):
+    """Issue one chat completion, retrying transient 429/timeout/connection errors"""
+    kwargs = {}
+    if json_mode and DEFAULT_MODEL in JSON_MODE_MODELS:
+        kwargs["response_format"] = {"type": "json_object"}
+    async with SEM, LIMITER:
+        response = await client.chat.completions.create(
+            model=DEFAULT_MODEL,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+    if response.usage:
+        LIMITER.count_tokens(response.usage.total_tokens)
+    return response
+
+
+def _build_prompt(filename, context_files=None, existing_metadata=None):
+    """Build the single-file metadata prompt sent to OpenRouter"""
     context = ""
     if context_files:
         context = f"\n\nOther files in the same folder: {', '.join(context_files[:10])}"
-    
+
     existing_context = ""
     if existing_metadata:
         existing_context = f"\n\nExisting metadata (may be incomplete/incorrect): {json.dumps(existing_metadata)}"
-    
-    prompt = f"""Analyze this classical music filename and extract metadata as JSON.
+
+    return f"""Analyze this classical music filename and extract metadata as JSON.
 
 Filename: {filename}
 {existing_context}
 
 Return ONLY valid JSON with these fields (use null if uncertain):
-{{
-    "composer": "Last name, First name",
-    "composer_short": "Last name only (e.g., Beethoven, Mozart, Chopin)",
-    "work_full": "Full official work title with catalog number (e.g., Piano Concerto No. 2 in B-flat major, Op. 19)",
-    "work_short": "SHORT searchable name that people actually search for (e.g., Piano Concerto No. 2, Symphony No. 5, Nocturne Op. 9 No. 2, Moonlight Sonata)",
-    "movement": "Movement number and name if applicable (e.g., II. Adagio sostenuto)",
-    "movement_name": "Just the movement name without number if exists (e.g., Adagio sostenuto)",
-    "performers": ["Primary performer/conductor names"],
-    "orchestra": "Orchestra/Ensemble name",
-    "soloists": ["Soloist names with instrument"],
-    "date": "Recording year if present",
-    "disc": "Disc number if multi-disc",
-    "track": "Track number (just the number, e.g., 01, 02, 12)",
-    "suggested_filename": "MUST use work_short NOT work_full! Format: TrackNum - ComposerShort - WorkShort - Movement - Performer"
-}}
-
-CRITICAL Guidelines for suggested_filename:
-- ALWAYS use the SHORT searchable work name (work_short), NOT the full official name!
-- Users need to SEARCH for these files - use names people actually search for
-- BAD: "01 - Beethoven - Piano Sonata No. 14 in C-sharp minor, Op. 27 No. 2 - I. Adagio sostenuto - Pollini" (TOO LONG!)
-- GOOD: "01 - Beethoven - Moonlight Sonata - I. Adagio sostenuto - Pollini"
-- BAD: "05 - Mozart - Piano Concerto No. 21 in C major, K. 467 - II. Andante - Uchida"
-- GOOD: "05 - Mozart - Piano Concerto No. 21 - II. Andante - Uchida"
-- Keep filenames SHORT and SEARCHABLE
-- No catalog numbers (Op., K., BWV) in filename - put those in work_full only
-- No key signatures in filename (C major, D minor, etc.)
+{METADATA_FIELDS_SPEC}
 
-Other guidelines:
-- Composer should be "Last, First" format, composer_short is just "Last"
-- work_full should include catalog numbers and key for metadata storage
-- work_short should be what people type when searching (simple, memorable names)
+{METADATA_GUIDELINES}
 
 {context}"""
 
+
+async def get_metadata_from_openrouter(client, filename, context_files=None, existing_metadata=None):
+    """Use OpenRouter to parse filename and generate metadata"""
+
+    cache_key = None
+    if CACHE is not None:
+        cache_key = _cache_key(filename, context_files, existing_metadata)
+        cached = CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+    prompt = _build_prompt(filename, context_files, existing_metadata)
+
     try:
-        response = client.chat.completions.create(
-            model=DEFAULT_MODEL,
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-        )
+        response = await _create_completion(client, prompt, json_mode=True)
         text = response.choices[0].message.content.strip()
-        
-        # Extract JSON from response (handle markdown code blocks)
-        json_match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
-        if json_match:
-            text = json_match.group(1)
-        elif text.startswith('```') and text.endswith('```'):
-            text = text.strip('`').strip()
-            if text.startswith('json'):
-                text = text[4:].strip()
-        
+        if DEFAULT_MODEL not in JSON_MODE_MODELS:
+            text = _strip_code_fences(text)
         metadata = json.loads(text)
+        if CACHE is not None and metadata:
+            CACHE.set(cache_key, metadata, expire=CACHE_EXPIRE)
         return metadata
     except Exception as e:
         console.print(f"  [red]✗ Error parsing with OpenRouter:[/red] {e}")
         return None
 
 
+# Compiled once - this runs on every non-JSON-mode response
+_JSON_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+
+def _strip_code_fences(text):
+    """Extract JSON from a response that may wrap it in markdown code blocks"""
+    json_match = _JSON_RE.search(text)
+    if json_match:
+        return json_match.group(1)
+    if text.startswith('```') and text.endswith('```'):
+        text = text.strip('`').strip()
+        if text.startswith('json'):
+            text = text[4:].strip()
+    return text
+
+
+async def get_metadata_batch(client, filenames, context_files=None):
+    """Request metadata for several filenames in a single OpenRouter call.
+
+    Packing a batch into one prompt amortizes the prompt overhead and the
+    per-request rate limit across the batch. Returns a list of metadata
+    dicts parallel to `filenames`; falls back to per-file requests when
+    the response array doesn't line up with the input.
+    """
+    # Serve whatever we can from the cache and only request the misses
+    cached = {}
+    if CACHE is not None:
+        for name in filenames:
+            hit = CACHE.get(_cache_key(name, context_files))
+            if hit is not None:
+                cached[name] = hit
+    missing = [name for name in filenames if name not in cached]
+
+    if not missing:
+        return [cached[name] for name in filenames]
+
+    if len(missing) == 1:
+        only = await get_metadata_from_openrouter(client, missing[0], context_files)
+        cached[missing[0]] = only
+        return [cached.get(name) for name in filenames]
+
+    context = ""
+    if context_files:
+        context = f"\n\nOther files in the same folder: {', '.join(context_files[:10])}"
+
+    file_list = "\n".join(f"{i}. {name}" for i, name in enumerate(missing, 1))
+    prompt = f"""Analyze these classical music filenames and extract metadata as JSON.
+
+Filenames:
+{file_list}
+
+Return ONLY a valid JSON array with EXACTLY {len(missing)} objects, one per
+filename, in the same order. Each object has these fields (use null if uncertain):
+{METADATA_FIELDS_SPEC}
+
+{METADATA_GUIDELINES}
+
+{context}"""
+
+    try:
+        # JSON mode guarantees an object, not an array, so batch responses
+        # keep the code-fence stripping path and scale the token cap
+        response = await _create_completion(
+            client, prompt, max_tokens=MAX_RESPONSE_TOKENS * len(missing))
+        text = _strip_code_fences(response.choices[0].message.content.strip())
+        results = json.loads(text)
+        if not isinstance(results, list) or len(results) != len(missing):
+            got = len(results) if isinstance(results, list) else type(results).__name__
+            raise ValueError(f"expected {len(missing)} metadata objects, got {got}")
+    except (json.JSONDecodeError, ValueError) as e:
+        # A malformed batch response is worth retrying file-by-file, but
+        # transport errors have already exhausted their retries - let those
+        # propagate instead of multiplying the failure across the batch.
+        console.print(f"  [yellow]⚠ Batch request failed ({e}), retrying files individually[/yellow]")
+        tasks = [get_metadata_from_openrouter(client, name, context_files) for name in missing]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for name, metadata in zip(missing, results):
+        cached[name] = metadata
+        if (CACHE is not None and metadata
+                and not isinstance(metadata, Exception)):
+            CACHE.set(_cache_key(name, context_files), metadata, expire=CACHE_EXPIRE)
+
+    return [cached.get(name) for name in filenames]
+
+
+def scan_library(folder):
+    """Walk the library once with os.scandir, bucketing FLAC files by directory.
+
+    Returns {directory: [file paths]}. One pass replaces the separate
+    *.flac / *.FLAC rglob walks (case-insensitive match) and gives every
+    consumer its folder context without re-globbing per file.
+    """
+    by_dir = {}
+    stack = [Path(folder)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # Skip hidden entries: conversion temp files and the
+                    # same-volume .backups folder must not be rescanned
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.name.lower().endswith('.flac'):
+                        by_dir.setdefault(directory, []).append(Path(entry.path))
+        except OSError:
+            continue
+    return by_dir
+
+
+def sniff_header(file_path):
+    """Classify a file from one 16-byte header probe.
+
+    Returns (is_flac, format). A single os.open/os.pread replaces the
+    separate header reads validate_flac_file and detect_actual_format
+    used to make, halving the open() traffic per file.
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            header = os.pread(fd, 16, 0)
+        finally:
+            os.close(fd)
+    except OSError:
+        return False, 'unknown'
+
+    if header[:4] == b'fLaC':
+        return True, 'flac'
+    elif header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+        return False, 'wav'
+    elif header[:3] == b'ID3' or header[:2] == b'\xff\xfb':
+        return False, 'mp3'
+    elif header[:4] == b'OggS':
+        return False, 'ogg'
+    elif header[4:8] == b'ftyp' or header[:4] == b'\x00\x00\x00\x18' or header[:4] == b'\x00\x00\x00\x1c' or header[:4] == b'\x00\x00\x00 ':
+        # MP4/M4A container (ftyp box or size header)
+        return False, 'm4a'
+    return False, 'unknown'
+
+
+# Scan results reused across menu round-trips, keyed by folder path with
+# a cheap mtime fingerprint; mutating menu actions drop their entry
+_SCAN_CACHE = {}  # str(folder) -> (fingerprint, by_dir)
+
+
+def _folder_fingerprint(folder_path):
+    """Cheap change detector: the folder's mtime plus its immediate
+    entries' mtimes. Deep edits made behind its back can slip past this,
+    so actions that modify the library invalidate the cache explicitly.
+    """
+    try:
+        total = os.stat(folder_path).st_mtime_ns
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                total += entry.stat(follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return None
+    return total
+
+
+def scan_library_cached(folder_path):
+    """scan_library with reuse across menu iterations on an unchanged tree"""
+    key = str(folder_path)
+    fingerprint = _folder_fingerprint(folder_path)
+    hit = _SCAN_CACHE.get(key)
+    if hit and fingerprint is not None and hit[0] == fingerprint:
+        return hit[1]
+    by_dir = scan_library(folder_path)
+    _SCAN_CACHE[key] = (fingerprint, by_dir)
+    return by_dir
+
+
 def validate_flac_file(file_path):
     """Check if file is a valid FLAC file"""
+    # Sniff the header first and skip the mutagen parse entirely for
+    # files that aren't FLAC at all
+    is_flac, detected = sniff_header(file_path)
+    if not is_flac:
+        return False, f"Not a FLAC file (detected: {detected.upper()})"
+
     try:
-        # Check file header for FLAC signature
-        with open(file_path, 'rb') as f:
-            header = f.read(4)
-            if header != b'fLaC':
-                return False, f"Not a FLAC file (header: {header[:20]})"
-        
-        # Try to open with mutagen
         audio = FLAC(file_path)
         return True, audio
     except Exception as e:
         return False, str(e)
 
 
+# Essential fields for classical music, checked on every file
+REQUIRED_FIELDS = {
+    'composer': ['COMPOSER'],
+    'work': ['ALBUM', 'WORK'],
+    'title': ['TITLE'],
+    'artist': ['ARTIST', 'ALBUMARTIST'],
+}
+
+
 def has_proper_metadata(audio):
     """Check if FLAC file has proper classical music metadata"""
-    # Essential fields for classical music
-    required_fields = {
-        'composer': ['COMPOSER'],
-        'work': ['ALBUM', 'WORK'],
-        'title': ['TITLE'],
-        'artist': ['ARTIST', 'ALBUMARTIST'],
-    }
-    
     missing = []
-    for field_name, tag_options in required_fields.items():
+    for field_name, tag_options in REQUIRED_FIELDS.items():
         # Check if any of the tag options has a non-empty value
         has_value = False
         for tag in tag_options:
@@ -260,6 +651,30 @@ def has_proper_metadata(audio):
     return True, []
 
 
+def needs_audit(audio):
+    """Cheap local check for whether a file is worth an LLM audit pass.
+
+    Catches the problems the AI audit usually flags: incomplete
+    metadata, a COMPOSER not in "Last, First" form, or an ALBUM that is
+    byte-for-byte identical to TITLE (no movement/work split). Files
+    that pass all three are skipped entirely, saving the tokens.
+    """
+    has_metadata, _ = has_proper_metadata(audio)
+    if not has_metadata:
+        return True
+
+    composer = audio['COMPOSER'][0] if 'COMPOSER' in audio and audio['COMPOSER'] else ''
+    if composer and ',' not in composer:
+        return True
+
+    album = audio['ALBUM'][0] if 'ALBUM' in audio and audio['ALBUM'] else ''
+    title = audio['TITLE'][0] if 'TITLE' in audio and audio['TITLE'] else ''
+    if album and album == title:
+        return True
+
+    return False
+
+
 def get_current_metadata(audio):
     """Extract current metadata from FLAC file for display"""
     metadata = {}
@@ -275,64 +690,73 @@ def get_current_metadata(audio):
 
 def detect_actual_format(file_path):
     """Detect the actual audio format based on file header"""
-    try:
-        with open(file_path, 'rb') as f:
-            header = f.read(12)
-            
-            # Check for various audio format signatures
-            if header[:4] == b'fLaC':
-                return 'flac'
-            elif header[:4] == b'RIFF' and header[8:12] == b'WAVE':
-                return 'wav'
-            elif header[:3] == b'ID3' or header[:2] == b'\xff\xfb':
-                return 'mp3'
-            elif header[:4] == b'OggS':
-                return 'ogg'
-            elif header[4:8] == b'ftyp' or header[:4] == b'\x00\x00\x00\x18' or header[:4] == b'\x00\x00\x00\x1c' or header[:4] == b'\x00\x00\x00 ':
-                # MP4/M4A container (ftyp box or size header)
-                return 'm4a'
-            else:
-                return 'unknown'
-    except Exception:
-        return 'unknown'
+    _, detected = sniff_header(file_path)
+    return detected
 
 
-def convert_to_flac(file_path):
+async def convert_to_flac(file_path):
     """Convert non-FLAC audio file to FLAC using ffmpeg"""
     file_path = Path(file_path)
-    
+
+    # A mis-extensioned file that is already valid FLAC only needs a
+    # rename, not an O(track-length) re-encode
+    is_flac, actual_format = sniff_header(file_path)
+    if is_flac and file_path.suffix.lower() != '.flac':
+        try:
+            FLAC(str(file_path))
+        except Exception:
+            pass  # FLAC header but unreadable - let ffmpeg have a go
+        else:
+            new_path = file_path.with_suffix('.flac')
+            counter = 1
+            while new_path.exists():
+                new_path = file_path.with_name(f"{file_path.stem} ({counter}).flac")
+                counter += 1
+            file_path.rename(new_path)
+            console.print(f"  [green]✓[/green] {file_path.name}: already FLAC, renamed to {new_path.name} [dim](no transcode needed)[/dim]")
+            return FLAC(str(new_path))
+
     # Check if ffmpeg is available
     if not shutil.which('ffmpeg'):
         console.print("  [yellow]⚠ ffmpeg not found.[/yellow] Install with: [cyan]brew install ffmpeg[/cyan]")
         return None
-    
-    # Detect actual format for better messaging
-    actual_format = detect_actual_format(file_path)
-    console.print(f"  [blue]ℹ[/blue] Detected actual format: [bold]{actual_format.upper()}[/bold]")
-    
+
+    console.print(f"  [blue]ℹ[/blue] {file_path.name}: detected actual format [bold]{actual_format.upper()}[/bold]")
+
     # Create temporary output file with a clearly different name
     temp_output = file_path.parent / f".{file_path.stem}_converted.flac"
-    
-    # Create backup folder on Desktop
+
+    # Create backup folder on Desktop. When Desktop sits on a different
+    # filesystem than the music library (external drives), fall back to a
+    # .backups folder next to the file - a cross-device move would
+    # byte-copy the whole original instead of renaming it.
     backup_folder = Path.home() / "Desktop" / "music_backups"
     backup_folder.mkdir(parents=True, exist_ok=True)
-    
+    if os.stat(file_path).st_dev != os.stat(backup_folder).st_dev:
+        backup_folder = file_path.parent / ".backups"
+        backup_folder.mkdir(exist_ok=True)
+
     try:
-        console.print(f"  [cyan]🔄 Converting[/cyan] {actual_format.upper()} → FLAC...")
-        
-        # Run ffmpeg to convert to FLAC
+        console.print(f"  [cyan]🔄 Converting[/cyan] {file_path.name}: {actual_format.upper()} → FLAC...")
+
+        # Run ffmpeg to convert to FLAC, one encode per core at a time
         # Use -loglevel error to reduce output noise
-        result = subprocess.run([
-            'ffmpeg', '-y', 
-            '-loglevel', 'error',
-            '-i', str(file_path),
-            '-c:a', 'flac',
-            '-compression_level', '8',
-            str(temp_output)
-        ], capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+        async with FFMPEG_SEM:
+            proc = await asyncio.create_subprocess_exec(
+                'ffmpeg', '-y',
+                '-loglevel', 'error',
+                '-threads', '0',
+                '-i', str(file_path),
+                '-c:a', 'flac',
+                '-compression_level', str(FLAC_COMPRESSION),
+                str(temp_output),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            error_msg = stderr.decode().strip() if stderr else "Unknown error"
             console.print(f"  [red]✗ ffmpeg conversion failed:[/red] {error_msg[:300]}")
             if temp_output.exists():
                 temp_output.unlink()
@@ -353,20 +777,17 @@ def convert_to_flac(file_path):
             backup_path = backup_folder / f"{file_path.stem}_original_{actual_format}_{counter}{file_path.suffix}"
             counter += 1
         shutil.move(str(file_path), str(backup_path))
-        
-        # Replace with converted file
-        shutil.move(str(temp_output), str(file_path))
-        
-        console.print(f"  [green]✓ Converted successfully[/green] [dim](original saved to ~/Desktop/music_backups/)[/dim]")
-        
-        # Validate the new file
-        is_valid, audio = validate_flac_file(file_path)
-        if is_valid:
-            return audio
-        else:
-            console.print(f"  [red]✗ Converted file still not valid:[/red] {audio}")
-            return None
-            
+
+        # Replace with converted file. temp_output lives in the same
+        # directory, so this is an atomic rename, never a copy.
+        os.replace(temp_output, file_path)
+
+        console.print(f"  [green]✓ Converted[/green] {file_path.name} [dim](original saved to {backup_folder})[/dim]")
+
+        # ffmpeg's output is trusted - parse it once and hand the object on
+        # rather than re-running the header validation
+        return FLAC(str(file_path))
+
     except Exception as e:
         console.print(f"  [red]✗ Conversion error:[/red] {e}")
         if temp_output.exists():
@@ -388,30 +809,36 @@ def sanitize_filename(filename):
     return filename.strip()
 
 
+# Serializes the conflict check + rename: tag writers run on threads, and
+# two files racing to the same suggested name must not overwrite each other
+_RENAME_LOCK = threading.Lock()
+
+
 def rename_file(file_path, new_filename):
     """Rename a file safely, handling conflicts"""
     file_path = Path(file_path)
     new_filename = sanitize_filename(new_filename)
-    
+
     # Keep the original extension
     new_path = file_path.parent / f"{new_filename}{file_path.suffix}"
-    
+
     # If it's the same name, no need to rename
     if new_path == file_path:
         return file_path, False
-    
-    # Handle filename conflicts by adding a number
-    counter = 1
-    while new_path.exists() and new_path != file_path:
-        new_path = file_path.parent / f"{new_filename} ({counter}){file_path.suffix}"
-        counter += 1
-    
-    try:
-        file_path.rename(new_path)
-        return new_path, True
-    except Exception as e:
-        console.print(f"  [red]✗ Error renaming file:[/red] {e}")
-        return file_path, False
+
+    with _RENAME_LOCK:
+        # Handle filename conflicts by adding a number
+        counter = 1
+        while new_path.exists() and new_path != file_path:
+            new_path = file_path.parent / f"{new_filename} ({counter}){file_path.suffix}"
+            counter += 1
+
+        try:
+            file_path.rename(new_path)
+            return new_path, True
+        except Exception as e:
+            console.print(f"  [red]✗ Error renaming file:[/red] {e}")
+            return file_path, False
 
 
 def apply_metadata_to_flac(file_path, metadata, audio=None, rename=True):
@@ -519,7 +946,7 @@ def display_metadata_table(metadata, title="Metadata"):
     console.print(table)
 
 
-def process_folder_normal(folder_path, client, dry_run=False):
+async def process_folder_normal(folder_path, client, dry_run=False, by_dir=None):
     """Process all FLAC files in folder - normal mode (files missing metadata)"""
     folder = Path(folder_path)
     
@@ -532,8 +959,10 @@ def process_folder_normal(folder_path, client, dry_run=False):
         return
     
     # Get all FLAC files
-    with console.status("[bold green]Scanning for files...[/bold green]"):
-        flac_files = list(folder.rglob('*.flac')) + list(folder.rglob('*.FLAC'))
+    if by_dir is None:
+        with console.status("[bold green]Scanning for files...[/bold green]"):
+            by_dir = scan_library(folder)
+    flac_files = [f for files in by_dir.values() for f in files]
     
     if not flac_files:
         console.print(Panel(
@@ -557,71 +986,147 @@ def process_folder_normal(folder_path, client, dry_run=False):
     processed = 0
     skipped = 0
     failed = 0
-    
-    with Progress(
+
+    # Three-stage pipeline over bounded queues: (A) scan+validate feeds
+    # (B) LLM workers feeds (C) tag writers, so disk I/O, network I/O and
+    # tag writes overlap across files instead of running as whole phases.
+    q_val = asyncio.Queue(maxsize=64)    # validated files awaiting metadata
+    q_write = asyncio.Queue(maxsize=64)  # (file, audio, metadata) awaiting tags
+    loop = asyncio.get_running_loop()
+
+    progress = Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
         console=console
-    ) as progress:
-        task = progress.add_task("[cyan]Processing files...", total=len(flac_files))
-        
-        for i, file_path in enumerate(flac_files, 1):
-            filename = file_path.name
-            progress.update(task, description=f"[cyan]Processing:[/cyan] {filename[:40]}...")
-            
-            console.print(f"\n[bold][{i}/{len(flac_files)}][/bold] [white]{filename}[/white]")
-            
-            # Validate FLAC file before making API call
-            is_valid, result = validate_flac_file(file_path)
+    )
+
+    async def check_and_queue(file_path, audio):
+        """Queue the file for tagging unless it already has proper metadata"""
+        nonlocal skipped
+        has_metadata, missing_fields = has_proper_metadata(audio)
+        if has_metadata:
+            if VERBOSE:
+                console.print(f"  [green]✓[/green] {file_path.name}  [dim]already has proper metadata[/dim]")
+            skipped += 1
+            progress.advance(task)
+        else:
+            console.print(f"  [yellow]ℹ[/yellow] {file_path.name}  [dim]missing: {', '.join(missing_fields)}[/dim]")
+            await q_val.put((file_path, audio))
+
+    async def convert_and_queue(file_path):
+        """Convert an invalid file, then queue it like any other"""
+        nonlocal failed
+        audio = await convert_to_flac(file_path)
+        if audio is None:
+            console.print(f"  [dim]⏭ Skipping {file_path.name}[/dim]")
+            failed += 1
+            progress.advance(task)
+        else:
+            await check_and_queue(file_path, audio)
+
+    async def scan_and_validate():
+        """Stage A: validate every file, spawning conversions as found"""
+        conversions = []
+        for file_path in flac_files:
+            progress.update(task, description=f"[cyan]Validating:[/cyan] {file_path.name[:40]}...")
+            is_valid, result = await loop.run_in_executor(None, validate_flac_file, file_path)
             if not is_valid:
-                console.print(f"  [yellow]⚠[/yellow] {result}")
-                # Attempt to convert to FLAC
-                audio = convert_to_flac(file_path)
-                if audio is None:
-                    console.print(f"  [dim]⏭ Skipping file[/dim]")
-                    failed += 1
-                    progress.advance(task)
-                    continue
-                result = audio  # Use the converted audio object
-            
-            # Check if file already has proper metadata
-            has_metadata, missing_fields = has_proper_metadata(result)
-            if has_metadata:
-                console.print(f"  [green]✓[/green] Already has proper metadata")
-                skipped += 1
+                console.print(f"  [yellow]⚠[/yellow] {file_path.name}  [dim]{result} - queued for conversion[/dim]")
+                conversions.append(asyncio.ensure_future(convert_and_queue(file_path)))
+            else:
+                await check_and_queue(file_path, result)
+        if conversions:
+            await asyncio.gather(*conversions)
+
+    async def llm_worker():
+        """Stage B: drain waiting files into per-folder batched requests"""
+        while True:
+            item = await q_val.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    extra = q_val.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if extra is None:
+                    # sentinel meant for a sibling worker - hand it back
+                    q_val.put_nowait(None)
+                    break
+                batch.append(extra)
+
+            # One request per folder so each batch shares a single context
+            by_folder = {}
+            for file_path, audio in batch:
+                by_folder.setdefault(file_path.parent, []).append((file_path, audio))
+            for folder, group in by_folder.items():
+                context_files = [p.name for p in by_dir[folder]]
+                try:
+                    metadata_list = await get_metadata_batch(
+                        client, [fp.name for fp, _ in group], context_files)
+                except Exception as e:
+                    metadata_list = [e] * len(group)
+                for (file_path, audio), metadata in zip(group, metadata_list):
+                    await q_write.put((file_path, audio, metadata))
+
+    async def tag_writer():
+        """Stage C: apply metadata in a thread (audio.save is I/O-bound)"""
+        nonlocal processed, failed
+        while True:
+            item = await q_write.get()
+            if item is None:
+                return
+            file_path, audio, metadata = item
+
+            if isinstance(metadata, Exception):
+                console.print(f"  [red]✗[/red] {file_path.name}  [red]request failed:[/red] {metadata}")
+                failed += 1
                 progress.advance(task)
                 continue
-            else:
-                console.print(f"  [yellow]ℹ[/yellow] Missing: [dim]{', '.join(missing_fields)}[/dim]")
-            
-            # Get context from other files in same folder
-            context_files = [f.name for f in file_path.parent.glob('*.flac')]
-            
-            # Get metadata from OpenRouter
-            metadata = get_metadata_from_openrouter(client, filename, context_files)
-            
-            if metadata:
+
+            if not metadata or not isinstance(metadata, dict):
+                console.print(f"  [red]✗[/red] {file_path.name}  [red]failed to generate metadata[/red]")
+                failed += 1
+                progress.advance(task)
+                continue
+
+            if VERBOSE:
+                console.print(f"\n[bold][white]{file_path.name}[/white][/bold]")
                 display_metadata_table(metadata, title="Generated Metadata")
-                
-                if not dry_run:
-                    success, new_path = apply_metadata_to_flac(file_path, metadata, result)
-                    if success:
-                        console.print("[green]  ✓ Metadata applied successfully[/green]")
-                        processed += 1
-                    else:
-                        console.print("[red]  ✗ Failed to apply metadata[/red]")
-                        failed += 1
-                else:
-                    console.print("[yellow]  ⏸ Dry run - not applied[/yellow]")
+
+            summary = f"{metadata.get('composer') or '?'} — {metadata.get('work_short') or metadata.get('work_full') or '?'}"
+            if not dry_run:
+                success, new_path = await loop.run_in_executor(
+                    None, apply_metadata_to_flac, file_path, metadata, audio)
+                if success:
+                    console.print(f"  [green]✓[/green] {new_path.name}  [dim]{summary}[/dim]")
                     processed += 1
+                else:
+                    console.print(f"  [red]✗[/red] {file_path.name}  [red]failed to apply metadata[/red]")
+                    failed += 1
             else:
-                console.print("[red]  ✗ Failed to generate metadata[/red]")
-                failed += 1
-            
+                console.print(f"  [yellow]⏸[/yellow] {file_path.name}  [dim]{summary} (dry run)[/dim]")
+                processed += 1
             progress.advance(task)
-    
+
+    with Live(progress, console=console, refresh_per_second=10):
+        task = progress.add_task("[cyan]Processing files...", total=len(flac_files))
+
+        producer = asyncio.ensure_future(scan_and_validate())
+        workers = [asyncio.ensure_future(llm_worker()) for _ in range(LLM_WORKERS)]
+        writers = [asyncio.ensure_future(tag_writer()) for _ in range(TAG_WRITERS)]
+
+        await producer
+        for _ in workers:
+            await q_val.put(None)
+        await asyncio.gather(*workers)
+        for _ in writers:
+            await q_write.put(None)
+        await asyncio.gather(*writers)
+
     # Final summary
     console.print()
     summary_table = Table(title="Processing Summary", box=ROUNDED, border_style="green")
@@ -634,7 +1139,7 @@ def process_folder_normal(folder_path, client, dry_run=False):
     console.print(summary_table)
 
 
-def process_folder_audit(folder_path, client, dry_run=False, auto_approve=False):
+async def process_folder_audit(folder_path, client, dry_run=False, auto_approve=False, force_audit=False, by_dir=None):
     """Audit ALL files for metadata consistency and correct if necessary"""
     folder = Path(folder_path)
     
@@ -647,8 +1152,10 @@ def process_folder_audit(folder_path, client, dry_run=False, auto_approve=False)
         return
     
     # Get all FLAC files
-    with console.status("[bold green]Scanning for files...[/bold green]"):
-        flac_files = list(folder.rglob('*.flac')) + list(folder.rglob('*.FLAC'))
+    if by_dir is None:
+        with console.status("[bold green]Scanning for files...[/bold green]"):
+            by_dir = scan_library(folder)
+    flac_files = [f for files in by_dir.values() for f in files]
     
     if not flac_files:
         console.print(Panel(
@@ -670,48 +1177,224 @@ def process_folder_audit(folder_path, client, dry_run=False, auto_approve=False)
     ))
     console.print()
     
+    # Phase 1: validate files and collect current metadata
+    to_audit, verified, failed = await _validate_audit_files(flac_files, force_audit)
+
+    # Phase 2: fan out all analysis requests concurrently
+    analyzed = []
+    if to_audit:
+        console.print(f"\n[blue]🔍 Analyzing {len(to_audit)} files with AI concurrently...[/blue]")
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console
+        ) as progress:
+            task = progress.add_task("[magenta]Analyzing files...", total=len(to_audit))
+
+            async def analyze_one(file_path, current_metadata):
+                context_files = [p.name for p in by_dir[file_path.parent]]
+                metadata = await get_metadata_from_openrouter(client, file_path.name, context_files, current_metadata)
+                progress.advance(task)
+                return metadata
+
+            tasks = [analyze_one(fp, current) for fp, _, current in to_audit]
+            analyzed = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Phase 3: review suggestions and apply changes
+    _review_audit_results(to_audit, analyzed, dry_run, auto_approve,
+                          verified=verified, failed=failed, total=len(flac_files))
+
+
+async def process_folder_audit_batch(folder_path, client, dry_run=False, auto_approve=False, force_audit=False, by_dir=None):
+    """Audit ALL files through the Batch API (cheaper, runs offline)
+
+    Uploads one JSONL request per file, then polls until the batch
+    completes. Half the cost of the sync endpoint with much higher rate
+    limits - meant for large non-interactive audit runs.
+    """
+    folder = Path(folder_path)
+
+    if not folder.exists():
+        console.print(Panel(
+            f"[red]Folder does not exist:[/red] {folder_path}",
+            title="[bold red]Error[/bold red]",
+            border_style="red"
+        ))
+        return
+
+    # Get all FLAC files
+    if by_dir is None:
+        with console.status("[bold green]Scanning for files...[/bold green]"):
+            by_dir = scan_library(folder)
+    flac_files = [f for files in by_dir.values() for f in files]
+
+    if not flac_files:
+        console.print(Panel(
+            f"No FLAC files found in [cyan]{folder_path}[/cyan]",
+            title="[bold yellow]No Files[/bold yellow]",
+            border_style="yellow"
+        ))
+        return
+
+    mode_text = "[yellow]DRY RUN[/yellow] - No files will be modified" if dry_run else "[green]LIVE MODE[/green] - Files will be modified"
+    console.print(Panel(
+        f"[bold]Found:[/bold] {len(flac_files)} FLAC files\n"
+        f"[bold]Mode:[/bold] {mode_text}\n"
+        f"[bold]Path:[/bold] {folder_path}\n\n"
+        "[dim]Requests are submitted as one offline batch (~50% cheaper). "
+        "The batch may take a while to complete.[/dim]",
+        title="[bold magenta]═══ METADATA AUDIT (BATCH API) ═══[/bold magenta]",
+        border_style="magenta"
+    ))
+    console.print()
+
+    # Phase 1: validate files and collect current metadata
+    to_audit, verified, failed = await _validate_audit_files(flac_files, force_audit)
+    if not to_audit:
+        _review_audit_results([], [], dry_run, auto_approve,
+                              verified=verified, failed=failed, total=len(flac_files))
+        return
+
+    # Phase 2: submit one JSONL line per file and wait for the batch
+    lines = []
+    for file_path, _, current_metadata in to_audit:
+        context_files = [p.name for p in by_dir[file_path.parent]]
+        lines.append(json.dumps({
+            "custom_id": str(file_path),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": DEFAULT_MODEL,
+                "messages": [
+                    {"role": "user",
+                     "content": _build_prompt(file_path.name, context_files, current_metadata)}
+                ],
+                "max_tokens": MAX_RESPONSE_TOKENS,
+            },
+        }))
+    jsonl_payload = ("\n".join(lines) + "\n").encode()
+
+    console.print(f"[blue]📤 Submitting batch of {len(to_audit)} requests...[/blue]")
+    try:
+        batch_input = await client.files.create(
+            file=("audit_batch.jsonl", jsonl_payload), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        with console.status(f"[bold magenta]Waiting for batch {batch.id}...[/bold magenta]") as status:
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(30)
+                batch = await client.batches.retrieve(batch.id)
+                counts = getattr(batch, "request_counts", None)
+                done = f" ({counts.completed}/{counts.total} done)" if counts else ""
+                status.update(f"[bold magenta]Batch {batch.id}: {batch.status}{done}[/bold magenta]")
+
+        if batch.status != "completed":
+            console.print(f"[red]✗ Batch ended with status:[/red] {batch.status}")
+            return
+
+        # Phase 3: join results back to files by custom_id and review
+        output = await client.files.content(batch.output_file_id)
+    except openai.OpenAIError as e:
+        console.print(f"[red]✗ Batch API error:[/red] {e}")
+        return
+    metadata_by_path = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        response = entry.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        try:
+            text = response["body"]["choices"][0]["message"]["content"].strip()
+            metadata_by_path[entry["custom_id"]] = json.loads(_strip_code_fences(text))
+        except (KeyError, IndexError, json.JSONDecodeError) as e:
+            console.print(f"  [yellow]⚠ Unparseable batch result for {entry.get('custom_id')}:[/yellow] {e}")
+
+    analyzed = [metadata_by_path.get(str(fp)) for fp, _, _ in to_audit]
+    _review_audit_results(to_audit, analyzed, dry_run, auto_approve,
+                          verified=verified, failed=failed, total=len(flac_files))
+
+
+async def _validate_audit_files(flac_files, force_audit=False):
+    """Validate every file for audit, converting invalid ones to FLAC.
+
+    Unless force_audit is set, files that pass the local needs_audit
+    heuristic are verified without spending an LLM call. Returns
+    (to_audit, verified, failed) where to_audit holds
+    (file_path, audio, current_metadata) tuples.
+    """
+    to_audit = []
     verified = 0
-    updated = 0
-    skipped = 0
     failed = 0
-    
     total_files = len(flac_files)
-    
+
     for i, file_path in enumerate(flac_files, 1):
         filename = file_path.name
-        
-        # Progress indicator
-        progress_pct = int((i / total_files) * 100)
-        progress_bar = "━" * (progress_pct // 5) + "╺" + "─" * (20 - progress_pct // 5)
-        console.print(f"\n[magenta]Progress:[/magenta] [{progress_bar}] {progress_pct}%")
-        console.print(f"[bold][{i}/{total_files}][/bold] [white]{filename}[/white]")
-        
+
         # Validate FLAC file
         is_valid, result = validate_flac_file(file_path)
         if not is_valid:
+            console.print(f"\n[bold][{i}/{total_files}][/bold] [white]{filename}[/white]")
             console.print(f"  [yellow]⚠[/yellow] Invalid FLAC: {result}")
             # Attempt to convert to FLAC
-            audio = convert_to_flac(file_path)
+            audio = await convert_to_flac(file_path)
             if audio is None:
                 console.print(f"  [dim]⏭ Skipping file[/dim]")
                 failed += 1
                 continue
             result = audio
-        
-        # Get current metadata
-        current_metadata = get_current_metadata(result)
-        
-        if current_metadata:
-            display_metadata_table(current_metadata, title="Current Metadata")
-        else:
-            console.print("  [dim]No existing metadata[/dim]")
-        
-        # Ask AI to analyze and potentially improve metadata
-        context_files = [f.name for f in file_path.parent.glob('*.flac')]
-        
-        console.print("  [blue]🔍 Analyzing with AI...[/blue]")
-        new_metadata = get_metadata_from_openrouter(client, filename, context_files, current_metadata)
-        
+
+        # Skip the LLM for files that already look clean locally
+        if not force_audit and not needs_audit(result):
+            verified += 1
+            continue
+
+        to_audit.append((file_path, result, get_current_metadata(result)))
+
+    if verified:
+        console.print(f"\n[green]✓ {verified} files passed local checks[/green] [dim](skipping AI audit; use --force-audit to audit everything)[/dim]")
+
+    return to_audit, verified, failed
+
+
+def _review_audit_results(to_audit, analyzed, dry_run, auto_approve, verified=0, failed=0, total=None):
+    """Review the AI suggestions, then resolve all changes with one prompt.
+
+    Proposed changes are collected while the results stream past and
+    confirmed once at the end (apply all / review each / none), so a large
+    audit never serializes on one keystroke per file.
+    """
+    updated = 0
+    skipped = 0
+    pending = []  # (file_path, audio, new_metadata, changes_summary)
+
+    for i, ((file_path, result, current_metadata), new_metadata) in enumerate(zip(to_audit, analyzed), 1):
+        filename = file_path.name
+
+        if VERBOSE:
+            # Progress indicator
+            progress_pct = int((i / len(to_audit)) * 100)
+            progress_bar = "━" * (progress_pct // 5) + "╺" + "─" * (20 - progress_pct // 5)
+            console.print(f"\n[magenta]Progress:[/magenta] [{progress_bar}] {progress_pct}%")
+            console.print(f"[bold][{i}/{len(to_audit)}][/bold] [white]{filename}[/white]")
+
+            if current_metadata:
+                display_metadata_table(current_metadata, title="Current Metadata")
+            else:
+                console.print("  [dim]No existing metadata[/dim]")
+
+        if isinstance(new_metadata, Exception):
+            console.print(f"  [red]✗[/red] {filename}  [red]request failed:[/red] {new_metadata}")
+            new_metadata = None
+
         if new_metadata:
             # Check if metadata needs improvement
             changes_detected = False
@@ -777,38 +1460,70 @@ def process_folder_audit(folder_path, client, dry_run=False, auto_approve=False)
                     changes_summary.append(f"  • FILENAME: [red]{current_filename}[/red] → [green]{suggested_filename}[/green]")
             
             if changes_detected:
-                console.print("  [yellow]⚠ Changes recommended:[/yellow]")
+                console.print(f"\n  [yellow]⚠ Changes recommended for[/yellow] [white]{filename}[/white]:")
                 for change in changes_summary:
                     console.print(change)
-                
-                display_metadata_table(new_metadata, title="Suggested Metadata")
-                
-                if not dry_run:
-                    # Auto-approve or ask for confirmation
-                    should_apply = auto_approve or Confirm.ask("  Apply these changes?", default=True)
-                    if should_apply:
-                        if auto_approve:
-                            console.print("  [cyan]⚡ Auto-applying...[/cyan]")
-                        success, new_path = apply_metadata_to_flac(file_path, new_metadata, result)
-                        if success:
-                            console.print("  [green]✓ Metadata updated[/green]")
-                            updated += 1
-                        else:
-                            console.print("  [red]✗ Failed to update[/red]")
-                            failed += 1
-                    else:
-                        console.print("  [dim]⏭ Skipped by user[/dim]")
-                        skipped += 1
-                else:
+
+                if VERBOSE:
+                    display_metadata_table(new_metadata, title="Suggested Metadata")
+
+                if dry_run:
                     console.print("  [yellow]⏸ Dry run - not applied[/yellow]")
                     updated += 1
+                else:
+                    pending.append((file_path, result, new_metadata, changes_summary))
             else:
-                console.print("  [green]✓ Metadata looks consistent[/green]")
+                console.print(f"  [green]✓[/green] {filename}  [dim]metadata looks consistent[/dim]")
                 verified += 1
         else:
-            console.print("  [red]✗ Failed to analyze with AI[/red]")
+            console.print(f"  [red]✗[/red] {filename}  [red]failed to analyze with AI[/red]")
             failed += 1
-    
+
+    # Resolve everything with a single prompt instead of one per file
+    if pending:
+        if auto_approve:
+            mode = "a"
+        else:
+            console.print(f"\n[yellow]⚠ {len(pending)} files have recommended changes[/yellow]")
+            mode = Prompt.ask(
+                "  [cyan]Apply changes?[/cyan] [bold]a[/bold]=apply all / [bold]i[/bold]=review each / [bold]n[/bold]=none",
+                choices=["a", "i", "n"], default="a")
+
+        if mode == "n":
+            console.print("  [dim]⏭ All changes skipped[/dim]")
+            skipped += len(pending)
+        else:
+            if mode == "i":
+                to_apply = []
+                for entry in pending:
+                    file_path, _, _, changes_summary = entry
+                    console.print(f"\n[bold][white]{file_path.name}[/white][/bold]")
+                    for change in changes_summary:
+                        console.print(change)
+                    if Confirm.ask("  Apply these changes?", default=True):
+                        to_apply.append(entry)
+                    else:
+                        console.print("  [dim]⏭ Skipped by user[/dim]")
+                        skipped += 1
+            else:
+                to_apply = pending
+                console.print(f"  [cyan]⚡ Applying changes to {len(to_apply)} files...[/cyan]")
+
+            # audio.save() is I/O-bound, so write the batch across threads
+            def apply_one(entry):
+                file_path, audio, new_metadata, _ = entry
+                return entry, apply_metadata_to_flac(file_path, new_metadata, audio)
+
+            if to_apply:
+                with ThreadPoolExecutor(max_workers=(os.cpu_count() or 4)) as executor:
+                    for entry, (success, new_path) in executor.map(apply_one, to_apply):
+                        if success:
+                            console.print(f"  [green]✓[/green] {new_path.name}  [dim]updated[/dim]")
+                            updated += 1
+                        else:
+                            console.print(f"  [red]✗[/red] {entry[0].name}  [red]failed to update[/red]")
+                            failed += 1
+
     # Final summary
     console.print()
     summary_table = Table(title="Audit Summary", box=ROUNDED, border_style="magenta")
@@ -818,7 +1533,7 @@ def process_folder_audit(folder_path, client, dry_run=False, auto_approve=False)
     summary_table.add_row("[yellow]Updated[/yellow]", str(updated))
     summary_table.add_row("[cyan]Skipped[/cyan]", str(skipped))
     summary_table.add_row("[red]Failed[/red]", str(failed))
-    summary_table.add_row("[bold]Total[/bold]", str(len(flac_files)))
+    summary_table.add_row("[bold]Total[/bold]", str(total if total is not None else len(to_audit)))
     console.print(summary_table)
 
 
@@ -966,7 +1681,7 @@ def generate_cover_image_bytes(artist, album, title, work=None):
 
 
 
-def process_cover_art(folder_path, dry_run=False, force_overwrite=False):
+def process_cover_art(folder_path, dry_run=False, force_overwrite=False, by_dir=None):
     """Check for missing cover art and generate UNIQUE covers for each file"""
     if not HAS_PILLOW:
         console.print(Panel(
@@ -982,8 +1697,10 @@ def process_cover_art(folder_path, dry_run=False, force_overwrite=False):
         return
 
     # Find all FLAC files directly
-    with console.status("[bold green]Scanning for files...[/bold green]"):
-        flac_files = list(folder.rglob("*.flac"))
+    if by_dir is None:
+        with console.status("[bold green]Scanning for files...[/bold green]"):
+            by_dir = scan_library(folder)
+    flac_files = [f for files in by_dir.values() for f in files]
     
     console.print(Panel(
         f"[bold]Found:[/bold] {len(flac_files)} music files\n"
@@ -1071,7 +1788,7 @@ def process_cover_art(folder_path, dry_run=False, force_overwrite=False):
     console.print(f"\n[bold]Finished![/bold] Generated: {generated_count}, Skipped (Existing): {skipped_count}, Failed: {failed_count}\n")
 
 
-def show_statistics(folder_path):
+def show_statistics(folder_path, by_dir=None):
     """Display statistics about the music library"""
     folder = Path(folder_path)
     
@@ -1083,8 +1800,10 @@ def show_statistics(folder_path):
         ))
         return
     
-    with console.status("[bold green]Scanning for files...[/bold green]"):
-        flac_files = list(folder.rglob('*.flac')) + list(folder.rglob('*.FLAC'))
+    if by_dir is None:
+        with console.status("[bold green]Scanning for files...[/bold green]"):
+            by_dir = scan_library(folder)
+    flac_files = [f for files in by_dir.values() for f in files]
     
     if not flac_files:
         console.print(Panel(
@@ -1094,13 +1813,24 @@ def show_statistics(folder_path):
         ))
         return
     
-    # Analyze files
+    # Analyze files across a thread pool. mutagen parses in pure Python
+    # under the GIL, but the scan is dominated by file reads and stat()
+    # calls whose waits do overlap, so threads still help on slow disks
     with_metadata = 0
     without_metadata = 0
     missing_fields_count = {}
     composers = set()
     total_size = 0
-    
+
+    def analyze_one(file_path):
+        """Parse one file for the statistics pass (runs in a worker thread)"""
+        is_valid, result = validate_flac_file(file_path)
+        if not is_valid:
+            return None
+        has_meta, missing = has_proper_metadata(result)
+        composer = result['COMPOSER'][0] if 'COMPOSER' in result and result['COMPOSER'] else None
+        return has_meta, missing, composer, file_path.stat().st_size
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -1109,27 +1839,26 @@ def show_statistics(folder_path):
         console=console
     ) as progress:
         task = progress.add_task("[blue]Analyzing library...", total=len(flac_files))
-        
-        for file_path in flac_files:
-            is_valid, result = validate_flac_file(file_path)
-            if is_valid:
-                has_meta, missing = has_proper_metadata(result)
-                if has_meta:
-                    with_metadata += 1
-                else:
+
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 4) * 2) as executor:
+            for analysis in executor.map(analyze_one, flac_files, chunksize=32):
+                if analysis is None:
                     without_metadata += 1
-                    for field in missing:
-                        missing_fields_count[field] = missing_fields_count.get(field, 0) + 1
-                
-                # Get composer
-                if 'COMPOSER' in result and result['COMPOSER']:
-                    composers.add(result['COMPOSER'][0])
-                
-                total_size += file_path.stat().st_size
-            else:
-                without_metadata += 1
-            
-            progress.advance(task)
+                else:
+                    has_meta, missing, composer, size = analysis
+                    if has_meta:
+                        with_metadata += 1
+                    else:
+                        without_metadata += 1
+                        for field in missing:
+                            missing_fields_count[field] = missing_fields_count.get(field, 0) + 1
+
+                    if composer:
+                        composers.add(composer)
+
+                    total_size += size
+
+                progress.advance(task)
     
     # Display stats
     console.print()
@@ -1196,21 +1925,113 @@ or use environment variables.[/dim]
         console.print(f"[green]✓ Model set to:[/green] {DEFAULT_MODEL}")
 
 
-def main():
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Classical Music Metadata Tagger using OpenRouter API"
+    )
+    parser.add_argument('folder', nargs='?', default=None,
+                        help="Path to your music folder")
+    parser.add_argument('--max-requests-per-minute', type=int, default=60,
+                        help="Cap on OpenRouter requests per minute (default: 60)")
+    parser.add_argument('--max-tokens-per-minute', type=int, default=250000,
+                        help="Cap on OpenRouter tokens per minute (default: 250000)")
+    parser.add_argument('--flac-compression', type=int, default=5,
+                        choices=range(0, 9), metavar='0-8',
+                        help="ffmpeg FLAC compression level (default: 5; 8 is smallest but ~3x slower)")
+    parser.add_argument('--verbose', action='store_true',
+                        help="Render full metadata tables per file instead of one-line logs")
+    parser.add_argument('--force-audit', action='store_true',
+                        help="Audit every file with the AI, even ones that pass local checks")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Skip the on-disk response cache for this run")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="Empty the on-disk response cache before starting")
+    return parser.parse_args()
+
+
+async def main():
+    global CACHE, VERBOSE, FLAC_COMPRESSION
+
+    args = parse_args()
+    LIMITER.max_requests_per_minute = args.max_requests_per_minute
+    LIMITER.max_tokens_per_minute = args.max_tokens_per_minute
+    VERBOSE = args.verbose
+    FLAC_COMPRESSION = args.flac_compression
+
+    if args.clear_cache:
+        diskcache.Cache(str(CACHE_DIR)).clear()
+        console.print("[green]✓ Response cache cleared[/green]")
+    if not args.no_cache:
+        CACHE = diskcache.Cache(str(CACHE_DIR))
+
     # Interactive TUI mode
-    console.clear()
-    show_banner()
-    
-    # Check for command line folder path argument
-    folder_path = None
-    if len(sys.argv) >= 2 and not sys.argv[1].startswith('--'):
-        folder_path = sys.argv[1]
-        console.print(f"[green]✓ Folder path:[/green] {folder_path}\n")
-    
+    _redraw_screen()
+
+    # Check for command line folder path argument (shown by the menu screen)
+    folder_path = args.folder
+
     # Setup API client
     client = setup_openrouter()
     console.print("[green]✓ API client initialized[/green]\n")
-    
+
+    try:
+        await _menu_loop(folder_path, client, args)
+    finally:
+        # Tear down the shared connection pool
+        await client.close()
+        if HTTP_CLIENT is not None:
+            await HTTP_CLIENT.aclose()
+
+
+async def _menu_loop(folder_path, client, args):
+    # Per-option handlers, resolved once into a dispatch dict instead of
+    # re-walking an if/elif ladder every round-trip
+    async def _do_normal(folder_path, by_dir):
+        dry_run = Confirm.ask("Run in dry-run mode (preview only)?", default=False)
+        await process_folder_normal(folder_path, client, dry_run, by_dir=by_dir)
+
+    async def _do_audit(folder_path, by_dir):
+        console.print(_AUDIT_PANEL)
+
+        if Confirm.ask("Continue with audit?", default=True):
+            dry_run = Confirm.ask("Run in dry-run mode (preview only)?", default=False)
+            if not dry_run:
+                auto_approve = Confirm.ask("[cyan]Auto-approve all changes?[/cyan] (say Yes to apply all without prompting)", default=False)
+            else:
+                auto_approve = False
+            use_batch = Confirm.ask(
+                "[cyan]Use the Batch API?[/cyan] (~50% cheaper, waits for an offline batch)",
+                default=False)
+            if use_batch:
+                await process_folder_audit_batch(folder_path, client, dry_run, auto_approve,
+                                                 force_audit=args.force_audit, by_dir=by_dir)
+            else:
+                await process_folder_audit(folder_path, client, dry_run, auto_approve,
+                                           force_audit=args.force_audit, by_dir=by_dir)
+
+    async def _do_stats(folder_path, by_dir):
+        show_statistics(folder_path, by_dir=by_dir)
+
+    async def _do_settings(folder_path, by_dir):
+        show_settings()
+
+    async def _do_cover(folder_path, by_dir):
+        dry_run = Confirm.ask("Run in dry-run mode?", default=False)
+        if not dry_run:
+            force_overwrite = Confirm.ask("[red]Overwrite existing covers?[/red]", default=False)
+        else:
+            force_overwrite = False
+        process_cover_art(folder_path, dry_run, force_overwrite, by_dir=by_dir)
+
+    dispatch = {
+        '1': _do_normal,
+        '2': _do_audit,
+        '3': _do_stats,
+        '4': _do_settings,
+        '6': _do_cover,
+    }
+
     while True:
         choice = show_menu(folder_path)
         
@@ -1227,71 +2048,42 @@ def main():
             console.print()
             folder_path = Prompt.ask(
                 "[cyan]Enter path to music folder[/cyan]",
-                default=str(Path.home() / "Music")
+                default=_DEFAULT_MUSIC_DIR
             )
-            console.clear()
-            show_banner()
-            console.print(f"[green]✓ Folder path:[/green] {folder_path}\n")
+            _redraw_screen()
             continue
         
         # Get folder path if not set
-        if choice in ['1', '2', '3'] and folder_path is None:
+        if choice in _NEEDS_FOLDER and folder_path is None:
             console.print()
             folder_path = Prompt.ask(
                 "[cyan]Enter path to music folder[/cyan]",
-                default=str(Path.home() / "Music")
+                default=_DEFAULT_MUSIC_DIR
             )
         
         console.print()
-        
-        if choice == '1':
-            # Process new files
-            dry_run = Confirm.ask("Run in dry-run mode (preview only)?", default=False)
-            process_folder_normal(folder_path, client, dry_run)
-        
-        elif choice == '2':
-            # Metadata audit
-            console.print(Panel(
-                "[bold magenta]Metadata Audit Mode[/bold magenta]\n\n"
-                "This will scan [bold]ALL[/bold] files in your library and use AI to:\n"
-                "  • Verify existing metadata is correct and consistent\n"
-                "  • Suggest corrections for incomplete or incorrect entries\n"
-                "  • Standardize formatting (e.g., 'Last, First' for composers)\n"
-                "  • Rename files to searchable format\n\n"
-                "[yellow]You can choose to auto-approve all changes or review each one.[/yellow]",
-                border_style="magenta"
-            ))
-            
-            if Confirm.ask("Continue with audit?", default=True):
-                dry_run = Confirm.ask("Run in dry-run mode (preview only)?", default=False)
-                if not dry_run:
-                    auto_approve = Confirm.ask("[cyan]Auto-approve all changes?[/cyan] (say Yes to apply all without prompting)", default=False)
-                else:
-                    auto_approve = False
-                process_folder_audit(folder_path, client, dry_run, auto_approve)
-        
-        elif choice == '3':
-            # Statistics
-            show_statistics(folder_path)
-        
-        elif choice == '4':
-            # Settings
-            show_settings()
-        
-        elif choice == '6':
-            # Generate Cover Art
-            dry_run = Confirm.ask("Run in dry-run mode?", default=False)
-            if not dry_run:
-                force_overwrite = Confirm.ask("[red]Overwrite existing covers?[/red]", default=False)
-            else:
-                force_overwrite = False
-            process_cover_art(folder_path, dry_run, force_overwrite)
-        
+
+        # Walk the library once at the dispatch site and hand the scan to
+        # whichever handler runs, instead of each handler re-walking
+        by_dir = None
+        if choice in _SCANNED_CHOICES and folder_path and Path(folder_path).exists():
+            with console.status("[bold green]Scanning for files...[/bold green]"):
+                by_dir = scan_library_cached(folder_path)
+
+        handler = dispatch.get(choice)
+        if handler:
+            await handler(folder_path, by_dir)
+
+        # Options that modify the library (tagging renames files, cover art
+        # rewrites them) invalidate the cached scan for the next round
+        if choice in _MUTATING_CHOICES:
+            _SCAN_CACHE.pop(str(folder_path), None)
+
         console.print()
-        Prompt.ask("[dim]Press Enter to continue...[/dim]", default="")
-        console.clear()
-        show_banner()
+        _wait_enter()
+        _redraw_screen()
+
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())